@@ -0,0 +1,30 @@
+"""Shared configuration and helpers for the Python e2e tests.
+
+Kept separate from conftest.py so test modules can import it directly -
+importing a conftest only works by accident of pytest's default
+prepend import mode.
+"""
+
+import os
+
+from playwright.sync_api import expect
+
+# Test configuration
+BASE_URL = os.environ.get('TEST_BASE_URL', 'https://iconym.com')
+TEST_EMAIL = 'e2e-test@mytrimmy.test'
+TEST_PASSWORD = 'E2ETestPass123'
+
+# Cached login state (cookies/localStorage) so repeat runs skip the login form
+AUTH_STATE_PATH = '/tmp/mytrimmy-auth.json'
+AUTH_STATE_MAX_AGE = 3600  # seconds
+
+
+def dashboard_ready(page, timeout=15000):
+    """Wait for a dashboard element that confirms the user is logged in.
+
+    Comma-separated selector lists are only valid inside the CSS engine,
+    so use :text() pseudo-classes rather than two text= selectors.
+    """
+    expect(
+        page.locator(':text("Dashboard"), :text("Drop your logo")').first
+    ).to_be_visible(timeout=timeout)
@@ -0,0 +1,95 @@
+"""Shared Playwright fixtures for the Python e2e tests.
+
+The browser is session-scoped and the authenticated context is
+module-scoped, so ``pytest -n auto`` (pytest-xdist) can run e2e modules
+in parallel while each worker reuses one browser and one login.
+"""
+
+import os
+import re
+import time
+
+import pytest
+from playwright.sync_api import sync_playwright, expect
+
+from config import (
+    AUTH_STATE_MAX_AGE,
+    AUTH_STATE_PATH,
+    BASE_URL,
+    TEST_EMAIL,
+    TEST_PASSWORD,
+    dashboard_ready,
+)
+
+# Third-party analytics/telemetry hosts the tests never verify
+TRACKER_RE = re.compile(
+    r'google-analytics|googletagmanager|segment\.io|sentry\.io|posthog|hotjar|intercom|mixpanel'
+)
+
+LAUNCH_ARGS = [
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--no-sandbox',
+    '--disable-background-networking',
+    '--disable-features=TranslateUI,BackForwardCache',
+]
+
+
+def has_fresh_auth_state():
+    """Check whether a cached auth state exists and is less than an hour old."""
+    try:
+        return time.time() - os.path.getmtime(AUTH_STATE_PATH) < AUTH_STATE_MAX_AGE
+    except OSError:
+        return False
+
+
+def block_non_essential(route):
+    """Abort fonts, media, and analytics not under test; keep images."""
+    request = route.request
+    if (request.resource_type in ('font', 'media')
+            or TRACKER_RE.search(request.url)):
+        route.abort()
+    else:
+        route.continue_()
+
+
+@pytest.fixture(scope='session')
+def browser():
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        yield browser
+        browser.close()
+
+
+@pytest.fixture(scope='module')
+def logged_in_context(browser):
+    """Authenticated browser context; logs in at most once per module."""
+    reuse_auth = has_fresh_auth_state()
+    context = browser.new_context(
+        viewport={'width': 1024, 'height': 768},
+        user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) Playwright E2E',
+        storage_state=AUTH_STATE_PATH if reuse_auth else None
+    )
+    context.route('**/*', block_non_essential)
+
+    page = context.new_page()
+    if reuse_auth:
+        # Cached cookies/localStorage are loaded, skip the login form
+        page.goto(f"{BASE_URL}/dashboard")
+    else:
+        page.goto(f"{BASE_URL}/login")
+        expect(page.locator('input#email')).to_be_visible(timeout=15000)
+        page.fill('input#email', TEST_EMAIL)
+        page.fill('input#password', TEST_PASSWORD)
+        page.click('button:has-text("Sign in")')
+
+    # Wait for a dashboard element instead of a fixed delay
+    dashboard_ready(page)
+
+    if not reuse_auth:
+        # Cache the authenticated state for the next hour of runs
+        context.storage_state(path=AUTH_STATE_PATH)
+
+    page.close()
+    yield context
+    context.close()